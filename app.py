@@ -5,12 +5,15 @@ This module provides a web-based interface for interacting with the AI Task Mana
 using Streamlit.
 """
 
+import logging
 import os
+import time
 from datetime import datetime
+from typing import Iterable, Iterator
 import traceback
 import streamlit as st
 from dotenv import load_dotenv
-from main import TaskManagerAgent
+from constant import DISPLAY_WINDOW
 from logging_config import setup_logger
 
 logger = setup_logger("streamlit_ui")
@@ -24,12 +27,93 @@ st.set_page_config(
 
 load_dotenv()
 
-if "agent" not in st.session_state:
-    st.session_state.agent = None
-if "messages" not in st.session_state:
-    st.session_state.messages = []
-if "show_chat" not in st.session_state:
-    st.session_state.show_chat = True
+st.session_state.setdefault("agent", None)
+st.session_state.setdefault("messages", [])
+st.session_state.setdefault("show_chat", True)
+st.session_state.setdefault("env_ok", False)
+
+CHAT_ROLES = ("user", "assistant")
+
+SIDEBAR_HTML = """
+<div style="background: rgba(30, 30, 30, 0.9); padding: 0.6rem; border-radius: 0.5rem; margin-bottom: 1rem;">
+    <div style="font-size: 0.9rem; font-weight: 600; color: #ffffff; margin-bottom: 0.2rem;">👨‍💻 Author</div>
+    <div style="font-size: 0.75rem; color: #b0b0b0; margin-bottom: 0.5rem;">Abu Bakar Siddik - Machine Learning Engineer</div>
+    <div style="display: flex; justify-content: space-between; font-size: 0.75rem; gap: 0.5rem;">
+        <a href="mailto:abubakar1808031@gmail.com" style="color: #90caf9; text-decoration: none;" title="Email">✉️</a>
+        <a href="https://github.com/bakar31" target="_blank" style="color: #90caf9; text-decoration: none;" title="GitHub">GitHub</a>
+        <a href="https://linkedin.com/in/abu-bakar-siddik31" target="_blank" style="color: #90caf9; text-decoration: none;" title="LinkedIn">LinkedIn</a>
+    </div>
+</div>
+<style>
+    .stAlert {margin-bottom: 1rem;}
+    .stAlert .stAlert-content {padding: 1rem;}
+    .stAlert .stAlert-content code {background: rgba(255, 43, 43, 0.1); padding: 0.2rem 0.4rem; border-radius: 0.2rem;}
+    a {text-decoration: none; transition: opacity 0.2s;}
+    a:hover {opacity: 0.8;}
+</style>
+"""
+
+EXAMPLE_MESSAGES_HTML = """
+<div style='font-size: 0.92rem; color: #555; margin-bottom: 0.5rem;'>
+    <b>Example messages:</b>
+    <ul style='margin: 0.3em 0 0 1.2em; padding: 0; font-size: 0.89rem;'>
+        <li>Add a new task: <span style='color:#888;'>"Add task: Buy groceries"</span></li>
+        <li>Show all tasks: <span style='color:#888;'>"Show me all my tasks"</span></li>
+        <li>Mark task as done: <span style='color:#888;'>"Mark 'Buy groceries' as done"</span></li>
+        <li>Change due date: <span style='color:#888;'>"Change the due date of 'Write report' to Friday"</span></li>
+        <li>Generate report: <span style='color:#888;'>"Generate a weekly report"</span></li>
+    </ul>
+</div>
+"""
+
+
+def get_agent():
+    """
+    Build a TaskManagerAgent for the current session.
+
+    Each session gets its own agent so conversations stay private; the
+    Groq client, tool modules and system prompt it uses are cached by
+    main and shared across sessions. The import is deferred so a missing
+    API key is reported before the tool modules are loaded.
+    """
+    from main import TaskManagerAgent
+
+    return TaskManagerAgent()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _task_summary(version: int) -> dict:
+    """
+    Return the all-time task report used by the sidebar metrics.
+
+    Args:
+        version: TaskManagerAgent.tasks_version; a new value invalidates the cache
+
+    Returns:
+        Dict containing the task report
+    """
+    return st.session_state.agent.get_summary()
+
+
+def _append_message(message: dict) -> dict:
+    """
+    Append a message to the chat history.
+
+    The role and content are normalized here so display_chat can render
+    messages without per-message checks.
+
+    Args:
+        message: Dictionary with at least ``role`` and ``content`` keys
+
+    Returns:
+        The appended message
+    """
+    if message.get("role") not in CHAT_ROLES:
+        message["role"] = "user"
+    content = message.get("content")
+    message["content"] = "" if content is None else str(content)
+    st.session_state.messages.append(message)
+    return message
 
 
 def initialize_agent():
@@ -41,20 +125,22 @@ def initialize_agent():
 
     try:
         logger.info("Initializing TaskManagerAgent...")
-        st.session_state.agent = TaskManagerAgent()
-        st.session_state.messages = [
+        st.session_state.agent = get_agent()
+        st.session_state.messages = []
+        _append_message(
             {
                 "role": "assistant",
                 "content": "Hello! I'm your AI Task Assistant. How can I help you manage your tasks today?",
             }
-        ]
+        )
         logger.info("TaskManagerAgent initialized successfully")
-        st.rerun()
+        return True
 
     except Exception as e:
         error_msg = f"Failed to initialize AI agent: {str(e)}"
         logger.error(error_msg)
-        logger.debug(f"Traceback: {traceback.format_exc()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Traceback: %s", traceback.format_exc())
         st.error(error_msg)
         st.stop()
 
@@ -92,7 +178,7 @@ def format_tool_call(tool_call):
         tool_call.get("status", ""), "❓"
     )
 
-    task = tool_call.get("result", {}).get("task", {}) or {}
+    task = (tool_call.get("result") or {}).get("task") or {}
 
     tool_name = tool_call.get("name", "unknown")
     tool_info = f"{status_emoji} **{tool_name}**\n"
@@ -121,109 +207,145 @@ def format_tool_call(tool_call):
     return tool_info
 
 
-def display_chat():
+def _throttle(
+    gen: Iterable[str], min_ms: int = 50, min_chars: int = 8
+) -> Iterator[str]:
     """
-    Display the chat interface and handle user interactions.
+    Batch streamed text deltas to limit how often the UI is updated.
 
-    Handles displaying the chat history and processing user input.
+    Args:
+        gen: Iterable of text deltas
+        min_ms: Minimum milliseconds between flushes
+        min_chars: Number of buffered characters that forces a flush
+
+    Yields:
+        Concatenated text deltas
     """
-    try:
-        st.title("AI Task Manager")
-        st.caption("Talk to your AI assistant to manage your tasks")
+    buffer = []
+    buffered_chars = 0
+    last_flush = time.monotonic()
 
-        for i, message in enumerate(st.session_state.messages):
-            try:
-                role = message.get("role", "user")
-                with st.chat_message(role):
-                    if role == "assistant" and "tool_calls" in message:
-                        for tool_call in message["tool_calls"]:
-                            st.markdown(f"🔧 **Tool Call:** {tool_call['name']}")
-                            st.json(tool_call["arguments"], expanded=False)
-                            if "output" in tool_call:
-                                st.markdown("📤 **Output:**")
-                                st.code(str(tool_call["output"]))
-
-                    content = message.get("content", "")
-                    if content:
-                        if not isinstance(content, str):
-                            content = str(content)
-                        st.markdown(content)
-
-                    if role == "assistant" and "tool_status" in message:
-                        with st.expander("🛠️ Tool Execution Status", expanded=False):
-                            for tool_call in message["tool_status"]:
-                                st.markdown(format_tool_call(tool_call))
+    for delta in gen:
+        buffer.append(delta)
+        buffered_chars += len(delta)
+        now = time.monotonic()
+        if buffered_chars >= min_chars or (now - last_flush) * 1000 >= min_ms:
+            yield "".join(buffer)
+            buffer = []
+            buffered_chars = 0
+            last_flush = now
 
-            except Exception as e:
-                logger.error(f"Error displaying message {i}: {str(e)}")
-                logger.debug(f"Message content: {message}")
-                logger.debug(f"Traceback: {traceback.format_exc()}")
+    if buffer:
+        yield "".join(buffer)
 
-        if prompt := st.chat_input("How can I help you with your tasks?"):
-            try:
-                if not isinstance(prompt, str) or not prompt.strip():
-                    raise ValueError("Empty or invalid input")
 
-                st.session_state.messages.append(
-                    {"role": "user", "content": prompt.strip()}
-                )
-                with st.chat_message("user"):
-                    st.markdown(prompt)
+def _render_stream(chunks: Iterable[str]) -> str:
+    """
+    Render streamed text as plain text, then as markdown once complete.
 
-                with st.chat_message("assistant"):
-                    try:
-                        if (
-                            "agent" not in st.session_state
-                            or not st.session_state.agent
-                        ):
-                            raise RuntimeError("AI agent is not initialized")
-
-                        prev_tool_calls_count = len(
-                            getattr(st.session_state.agent, "tool_calls", [])
-                        )
-                        response = st.session_state.agent.process_message(prompt)
+    Re-parsing growing markdown on every delta is costly, so the in-progress
+    reply is shown with ``text`` and only the final reply is rendered as
+    markdown.
 
-                        if not response or not isinstance(response, str):
-                            raise ValueError("Invalid response from AI agent")
+    Args:
+        chunks: Iterable of text deltas
 
-                        new_tool_calls = []
-                        if hasattr(st.session_state.agent, "tool_calls"):
-                            new_tool_calls = st.session_state.agent.tool_calls[
-                                prev_tool_calls_count:
-                            ]
+    Returns:
+        The full streamed text
+    """
+    placeholder = st.empty()
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        placeholder.text(buffer)
+    placeholder.markdown(buffer)
+    return buffer
 
-                        assistant_message = {
-                            "role": "assistant",
-                            "content": response,
-                        }
 
-                        if new_tool_calls:
-                            assistant_message["tool_status"] = new_tool_calls
+def _handle_prompt(prompt: str):
+    """
+    Send a user prompt to the agent and render the exchange.
 
-                        st.session_state.messages.append(assistant_message)
-                        st.markdown(response)
+    Args:
+        prompt: The user's message
+    """
+    try:
+        if not isinstance(prompt, str) or not prompt.strip():
+            raise ValueError("Empty or invalid input")
 
-                        if new_tool_calls:
-                            with st.expander("🛠️ Tool Execution Status", expanded=True):
-                                for tool_call in new_tool_calls:
-                                    st.markdown(format_tool_call(tool_call))
+        _append_message({"role": "user", "content": prompt.strip()})
+        with st.chat_message("user"):
+            st.markdown(prompt)
 
-                    except Exception as e:
-                        error_msg = f"I'm sorry, I encountered an error processing your request: {str(e)}"
-                        logger.error(f"Error in process_message: {str(e)}")
-                        logger.debug(f"Traceback: {traceback.format_exc()}")
+        with st.chat_message("assistant"):
+            try:
+                if "agent" not in st.session_state or not st.session_state.agent:
+                    raise RuntimeError("AI agent is not initialized")
 
-                        st.session_state.messages.append(
-                            {"role": "assistant", "content": error_msg}
-                        )
-                        st.error(error_msg)
+                response = _render_stream(
+                    _throttle(st.session_state.agent.stream_message(prompt))
+                )
+
+                if not response or not isinstance(response, str):
+                    raise ValueError("Invalid response from AI agent")
+
+                new_tool_calls = list(st.session_state.agent.tool_calls)
+
+                assistant_message = {
+                    "role": "assistant",
+                    "content": response,
+                }
+
+                if new_tool_calls:
+                    assistant_message["tool_status"] = new_tool_calls
+
+                _append_message(assistant_message)
+
+                if new_tool_calls:
+                    with st.expander("🛠️ Tool Execution Status", expanded=True):
+                        for tool_call in new_tool_calls:
+                            st.markdown(format_tool_call(tool_call))
 
             except Exception as e:
-                error_msg = f"Error processing your input: {str(e)}"
-                logger.error(error_msg)
-                logger.debug(f"Traceback: {traceback.format_exc()}")
+                error_msg = f"I'm sorry, I encountered an error processing your request: {str(e)}"
+                logger.error("Error in stream_message: %s", e)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Traceback: %s", traceback.format_exc())
+
+                _append_message({"role": "assistant", "content": error_msg})
                 st.error(error_msg)
 
+    except Exception as e:
+        error_msg = f"Error processing your input: {str(e)}"
+        logger.error(error_msg)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Traceback: %s", traceback.format_exc())
+        st.error(error_msg)
+
+
+def display_chat():
+    """
+    Display the chat interface and handle user interactions.
+
+    Handles displaying the chat history and processing user input.
+    """
+    try:
+        st.title("AI Task Manager")
+        st.caption("Talk to your AI assistant to manage your tasks")
+
+        for message in st.session_state.messages[-DISPLAY_WINDOW:]:
+            with st.chat_message(message["role"]):
+                if message["content"]:
+                    st.markdown(message["content"])
+
+                if "tool_status" in message:
+                    with st.expander("🛠️ Tool Execution Status", expanded=False):
+                        for tool_call in message["tool_status"]:
+                            st.markdown(format_tool_call(tool_call))
+
+        if prompt := st.chat_input("How can I help you with your tasks?"):
+            _handle_prompt(prompt)
+
     except Exception as e:
         error_msg = f"An unexpected error occurred in the chat interface: {str(e)}"
         logger.critical(error_msg, exc_info=True)
@@ -231,52 +353,28 @@ def display_chat():
         st.stop()
 
 
+@st.fragment
 def display_quick_actions():
     """
     Display quick action buttons and task summary in the sidebar.
 
+    Runs as a fragment so sidebar interactions only rerun this function.
+    Must be called inside a ``with st.sidebar:`` block, since fragments
+    cannot write to ``st.sidebar`` directly.
+
     Handles errors gracefully and provides feedback to the user.
     """
     try:
-        st.sidebar.title("Quick Actions")
-        st.sidebar.markdown(
-            """
-            <div style='font-size: 0.92rem; color: #555; margin-bottom: 0.5rem;'>
-                <b>Example messages:</b>
-                <ul style='margin: 0.3em 0 0 1.2em; padding: 0; font-size: 0.89rem;'>
-                    <li>Add a new task: <span style='color:#888;'>"Add task: Buy groceries"</span></li>
-                    <li>Show all tasks: <span style='color:#888;'>"Show me all my tasks"</span></li>
-                    <li>Mark task as done: <span style='color:#888;'>"Mark 'Buy groceries' as done"</span></li>
-                    <li>Change due date: <span style='color:#888;'>"Change the due date of 'Write report' to Friday"</span></li>
-                    <li>Generate report: <span style='color:#888;'>"Generate a weekly report"</span></li>
-                </ul>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-        st.sidebar.divider()
+        st.title("Quick Actions")
+        st.markdown(EXAMPLE_MESSAGES_HTML, unsafe_allow_html=True)
+        st.divider()
 
         try:
             if hasattr(st.session_state, "agent") and st.session_state.agent:
-                tool_call = type(
-                    "obj",
-                    (),
-                    {
-                        "function": type(
-                            "func",
-                            (),
-                            {
-                                "name": "generate_task_report",
-                                "arguments": '{"period": "all"}',
-                            },
-                        )
-                    },
-                )
-
-                summary = st.session_state.agent.handle_tool_call(tool_call)
+                summary = _task_summary(st.session_state.agent.tasks_version)
                 if summary and isinstance(summary, dict) and "summary" in summary:
-                    st.sidebar.subheader("Task Summary")
-                    col1, col2, col3 = st.sidebar.columns(3)
+                    st.subheader("Task Summary")
+                    col1, col2, col3 = st.columns(3)
 
                     try:
                         col1.metric("To Do", summary["summary"].get("todo", 0))
@@ -285,16 +383,22 @@ def display_quick_actions():
                         )
                         col3.metric("Done", summary["summary"].get("done", 0))
                     except Exception as e:
-                        logger.error(f"Error displaying metrics: {str(e)}")
-                        st.sidebar.error("Could not display task metrics.")
+                        logger.error("Error displaying metrics: %s", e)
+                        st.error("Could not display task metrics.")
 
         except Exception as e:
-            logger.error(f"Error loading task summary: {str(e)}")
-            logger.debug(f"Traceback: {traceback.format_exc()}")
+            logger.error("Error loading task summary: %s", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Traceback: %s", traceback.format_exc())
 
     except Exception as e:
-        logger.critical(f"Critical error in quick actions: {str(e)}", exc_info=True)
-        st.sidebar.error("An error occurred in the sidebar. Please refresh the page.")
+        logger.critical("Critical error in quick actions: %s", e, exc_info=True)
+        st.error("An error occurred in the sidebar. Please refresh the page.")
+
+    st.caption("AI Task Manager v1.0.0")
+
+    if st.button("🔄 Refresh Application"):
+        st.rerun()
 
 
 def check_environment() -> bool:
@@ -304,6 +408,11 @@ def check_environment() -> bool:
     Returns:
         bool: True if all required environment variables are set, False otherwise
     """
+    # A passing check stays valid for the session; a failing one is repeated
+    # on every rerun so fixing .env takes effect without a restart
+    if st.session_state.env_ok:
+        return True
+
     required_vars = ["GROQ_API_KEY"]
     missing_vars = [var for var in required_vars if not os.getenv(var)]
 
@@ -314,41 +423,22 @@ def check_environment() -> bool:
             "Please set them in your .env file or environment variables."
         )
         st.error(error_msg)
-        logger.error(f"Missing environment variables: {', '.join(missing_vars)}")
+        logger.error("Missing environment variables: %s", ", ".join(missing_vars))
         return False
+
+    st.session_state.env_ok = True
     return True
 
 
-def setup_page():
-    """Set up the Streamlit page configuration."""
-    st.set_page_config(
-        page_title="AI Task Manager",
-        page_icon="✅",
-        layout="wide",
-        initial_sidebar_state="expanded",
-    )
+@st.cache_resource
+def _inject_once():
+    """Emit the static sidebar markup; reruns replay it from the cache."""
+    st.sidebar.markdown(SIDEBAR_HTML, unsafe_allow_html=True)
 
-    st.sidebar.markdown(
-        """
-        <div style="background: rgba(30, 30, 30, 0.9); padding: 0.6rem; border-radius: 0.5rem; margin-bottom: 1rem;">
-            <div style="font-size: 0.9rem; font-weight: 600; color: #ffffff; margin-bottom: 0.2rem;">👨‍💻 Author</div>
-            <div style="font-size: 0.75rem; color: #b0b0b0; margin-bottom: 0.5rem;">Abu Bakar Siddik - Machine Learning Engineer</div>
-            <div style="display: flex; justify-content: space-between; font-size: 0.75rem; gap: 0.5rem;">
-                <a href="mailto:abubakar1808031@gmail.com" style="color: #90caf9; text-decoration: none;" title="Email">✉️</a>
-                <a href="https://github.com/bakar31" target="_blank" style="color: #90caf9; text-decoration: none;" title="GitHub">GitHub</a>
-                <a href="https://linkedin.com/in/abu-bakar-siddik31" target="_blank" style="color: #90caf9; text-decoration: none;" title="LinkedIn">LinkedIn</a>
-            </div>
-        </div>
-        <style>
-            .stAlert {margin-bottom: 1rem;}
-            .stAlert .stAlert-content {padding: 1rem;}
-            .stAlert .stAlert-content code {background: rgba(255, 43, 43, 0.1); padding: 0.2rem 0.4rem; border-radius: 0.2rem;}
-            a {text-decoration: none; transition: opacity 0.2s;}
-            a:hover {opacity: 0.8;}
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+
+def _inject_sidebar_styles():
+    """Render the author card and shared CSS in the sidebar."""
+    _inject_once()
 
 
 def main():
@@ -358,12 +448,10 @@ def main():
     Handles initialization, error handling, and the main application flow.
     """
     try:
-        setup_page()
+        _inject_sidebar_styles()
 
-        if "messages" not in st.session_state:
-            st.session_state.messages = []
-        if "show_chat" not in st.session_state:
-            st.session_state.show_chat = True
+        st.session_state.setdefault("messages", [])
+        st.session_state.setdefault("show_chat", True)
 
         if not check_environment():
             return
@@ -373,7 +461,8 @@ def main():
                 return
 
         try:
-            display_quick_actions()
+            with st.sidebar:
+                display_quick_actions()
             display_chat()
 
         except Exception as e:
@@ -388,11 +477,6 @@ def main():
         logger.critical(error_msg, exc_info=True)
         st.error("A critical error occurred. Please refresh the page and try again.")
 
-    st.sidebar.caption("AI Task Manager v1.0.0")
-
-    if st.sidebar.button("🔄 Refresh Application"):
-        st.rerun()
-
 
 if __name__ == "__main__":
     main()
@@ -2,3 +2,10 @@ MAX_ITERATIONS = 5
 TEMPERATURE = 0.3
 MAX_TOKENS = 1000
 FALLBACK_MODEL = "qwen-qwq-32b"
+DISPLAY_WINDOW = 50
+MAX_HISTORY_TURNS = 16
+HTTP_TIMEOUT = 30.0
+HTTP_CONNECT_TIMEOUT = 5.0
+HTTP_MAX_KEEPALIVE = 4
+RESPONSE_CACHE_TTL = 24 * 60 * 60
+RESPONSE_CACHE_MAX_ENTRIES = 500
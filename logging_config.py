@@ -4,8 +4,10 @@ Logging configuration for the AI Task Manager.
 This module sets up logging with a consistent format and log levels.
 """
 import os
+import atexit
+import queue
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 # Create logs directory if it doesn't exist
@@ -25,23 +27,31 @@ MAX_LOG_SIZE = 10 * 1024 * 1024
 # Number of backup logs to keep
 BACKUP_COUNT = 5
 
-def setup_logger(name: str = None, log_level: int = logging.INFO) -> logging.Logger:
+_HANDLERS_INITIALIZED = False
+
+# Records are queued by the calling thread and written by the listener thread
+log_queue = queue.Queue(-1)
+_listener = None
+
+
+def _init_handlers(log_level: int = logging.INFO) -> None:
     """
-    Set up a logger with the specified name and log level.
+    Attach a queue handler to the root logger exactly once.
+    
+    Named loggers propagate to the root logger, so they share its handler
+    instead of each opening their own log files. The console and file
+    handlers run on a background QueueListener, keeping disk I/O off the
+    calling thread.
     
     Args:
-        name: The name of the logger. If None, returns the root logger.
-        log_level: The log level (e.g., logging.INFO, logging.DEBUG).
-        
-    Returns:
-        The configured logger instance.
+        log_level: The log level for the root logger.
     """
-    logger = logging.getLogger(name)
-    logger.setLevel(log_level)
+    global _HANDLERS_INITIALIZED, _listener
+    if _HANDLERS_INITIALIZED:
+        return
     
-    # Don't add handlers if they're already set up
-    if logger.handlers:
-        return logger
+    root = logging.getLogger()
+    root.setLevel(log_level)
     
     # Create formatter
     formatter = logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
@@ -49,7 +59,6 @@ def setup_logger(name: str = None, log_level: int = logging.INFO) -> logging.Log
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
     
     # File handler for all logs
     file_handler = RotatingFileHandler(
@@ -59,7 +68,6 @@ def setup_logger(name: str = None, log_level: int = logging.INFO) -> logging.Log
         encoding='utf-8'
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
     
     # Error file handler (only ERROR level and above)
     error_file_handler = RotatingFileHandler(
@@ -70,11 +78,42 @@ def setup_logger(name: str = None, log_level: int = logging.INFO) -> logging.Log
     )
     error_file_handler.setLevel(logging.ERROR)
     error_file_handler.setFormatter(formatter)
-    logger.addHandler(error_file_handler)
     
+    root.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        error_file_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
+    
+    _HANDLERS_INITIALIZED = True
+
+
+def setup_logger(name: str = None, log_level: int = logging.INFO) -> logging.Logger:
+    """
+    Get a logger with the specified name and log level.
+    
+    Handlers live on the root logger (see _init_handlers), so this only
+    looks up the logger and sets its level.
+    
+    Args:
+        name: The name of the logger. If None, returns the root logger.
+        log_level: The log level (e.g., logging.INFO, logging.DEBUG).
+        
+    Returns:
+        The configured logger instance.
+    """
+    logger = logging.getLogger(name)
+    if logger.level != log_level:
+        logger.setLevel(log_level)
     return logger
 
 # Set up root logger
+_init_handlers()
 root_logger = setup_logger()
 
 # Example usage:
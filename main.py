@@ -7,39 +7,211 @@ tools, and user interface for the AI Task Manager.
 
 import os
 import json
+import functools
+import hashlib
+import itertools
+import shelve
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from types import SimpleNamespace
+from typing import Iterator, Optional
 from dotenv import load_dotenv
-import groq
-from groq import GroqError
-from constant import MAX_ITERATIONS, TEMPERATURE, MAX_TOKENS, FALLBACK_MODEL
-
-from tools.add_task import add_task, add_task_tool
-from tools.update_task_status import update_task_status, update_task_status_tool
-from tools.get_tasks_by_status import (
-    get_tasks_by_status,
-    get_all_tasks,
-    get_tasks_by_status_tool,
-    get_all_tasks_tool,
+import orjson
+from constant import (
+    MAX_ITERATIONS,
+    TEMPERATURE,
+    MAX_TOKENS,
+    FALLBACK_MODEL,
+    MAX_HISTORY_TURNS,
+    HTTP_TIMEOUT,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_MAX_KEEPALIVE,
+    RESPONSE_CACHE_TTL,
+    RESPONSE_CACHE_MAX_ENTRIES,
 )
-from tools.generate_task_report import generate_task_report, generate_task_report_tool
 from logging_config import setup_logger
 
 logger = setup_logger(__name__)
 load_dotenv()
 
-TOOLS = [
-    add_task_tool,
-    update_task_status_tool,
-    get_tasks_by_status_tool,
-    get_all_tasks_tool,
-    generate_task_report_tool,
-]
+RESPONSE_CACHE_PATH = Path(__file__).parent / "db" / "response_cache"
+
+TASK_MUTATING_TOOLS = {"add_task", "update_task_status"}
+
+
+@functools.cache
+def _load_tools() -> tuple[dict, list]:
+    """
+    Import the tool modules on first use.
+
+    The tool modules pull in pydantic and the database layer, so they are
+    only imported once an agent is actually created.
+
+    Returns:
+        Tuple of (function name to callable mapping, tool schemas for the API)
+    """
+    from tools.add_task import add_task, add_task_tool
+    from tools.update_task_status import update_task_status, update_task_status_tool
+    from tools.get_tasks_by_status import (
+        get_tasks_by_status,
+        get_all_tasks,
+        get_tasks_by_status_tool,
+        get_all_tasks_tool,
+    )
+    from tools.generate_task_report import (
+        generate_task_report,
+        generate_task_report_tool,
+    )
+
+    functions = {
+        "add_task": add_task,
+        "update_task_status": update_task_status,
+        "get_tasks_by_status": get_tasks_by_status,
+        "get_all_tasks": get_all_tasks,
+        "generate_task_report": generate_task_report,
+    }
+    schemas = [
+        add_task_tool,
+        update_task_status_tool,
+        get_tasks_by_status_tool,
+        get_all_tasks_tool,
+        generate_task_report_tool,
+    ]
+    return functions, schemas
+
+
+@functools.cache
+def _http_client():
+    """
+    Return the HTTP client shared by all agents in the process.
+
+    Reusing one client keeps connections to the Groq API alive between
+    requests instead of paying a new TLS handshake each time.
+
+    Returns:
+        A configured httpx.Client
+    """
+    import httpx
+
+    return httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=HTTP_MAX_KEEPALIVE),
+        timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+    )
+
+
+@functools.cache
+def _groq_client(api_key: str):
+    """
+    Return the Groq client shared by all agents using the given API key.
+
+    The client holds no conversation state, so every session can reuse it
+    while keeping its own message history on its own agent.
+
+    Args:
+        api_key: The Groq API key
+
+    Returns:
+        A groq.Client bound to the shared HTTP client
+    """
+    import groq
+
+    return groq.Client(api_key=api_key, http_client=_http_client())
+
+
+@functools.lru_cache(maxsize=1)
+def _load_system_prompt() -> str:
+    """
+    Read the system prompt file once per process.
+
+    Failures are not cached, so a missing or empty file is retried on the
+    next call.
+
+    Returns:
+        The stripped contents of prompts/system_prompt.txt
+
+    Raises:
+        FileNotFoundError: If the prompt file does not exist
+        ValueError: If the prompt file is empty
+    """
+    prompt_path = Path(__file__).parent / "prompts" / "system_prompt.txt"
+    if not prompt_path.exists():
+        raise FileNotFoundError(f"System prompt file not found at {prompt_path}")
+
+    with open(prompt_path, "r", encoding="utf-8") as f:
+        system_prompt = f.read().strip()
+
+    if not system_prompt:
+        raise ValueError("System prompt is empty")
+
+    return system_prompt
+
+
+def _assistant_message(content: Optional[str], tool_calls=None) -> dict:
+    """
+    Build a plain-dict assistant message for the conversation history.
+
+    Keeping every history entry a dict avoids re-serializing SDK models on
+    each request and keeps the history JSON-serializable.
+
+    Args:
+        content: The assistant's text, if any
+        tool_calls: Tool calls requested by the assistant, if any
+
+    Returns:
+        Dict in the chat completions message format
+    """
+    message = {"role": "assistant", "content": content}
+    if tool_calls:
+        message["tool_calls"] = [
+            {
+                "id": tool_call.id,
+                "type": "function",
+                "function": {
+                    "name": tool_call.function.name,
+                    "arguments": tool_call.function.arguments,
+                },
+            }
+            for tool_call in tool_calls
+        ]
+    return message
+
+
+def _evict_responses(cache: shelve.Shelf):
+    """
+    Make room in the response cache for one more reply.
+
+    Args:
+        cache: The open response cache
+    """
+    now = time.time()
+    stored = []
+    for key in list(cache):
+        entry = cache[key]
+        if not isinstance(entry, tuple) or now - entry[0] > RESPONSE_CACHE_TTL:
+            del cache[key]
+        else:
+            stored.append((entry[0], key))
+
+    stored.sort()
+    excess = len(stored) - RESPONSE_CACHE_MAX_ENTRIES + 1
+    for _, key in stored[: max(excess, 0)]:
+        del cache[key]
 
 
 class TaskManagerAgent:
     """Main application class for the AI Task Manager."""
 
+    # Bumped whenever a tool call changes stored tasks; kept on the class
+    # because every agent in the process shares the same database
+    tasks_version = 0
+
+    @property
+    def tools(self) -> list:
+        """Tool schemas passed to the chat completions API."""
+        return _load_tools()[1]
+
     def __init__(self):
         """Initialize the TaskManagerAgent with Groq client and tools."""
         try:
@@ -47,42 +219,124 @@ class TaskManagerAgent:
             if not api_key:
                 raise ValueError("GROQ_API_KEY environment variable is not set")
 
-            self.client = groq.Client(api_key=api_key)
+            self.client = _groq_client(api_key)
+            self._tool_funcs = _load_tools()[0]
             self.messages = []
+            # Tool calls made while answering the latest message
             self.tool_calls = []
+            self._tool_call_ids = itertools.count(1)
             self.load_system_prompt()
             logger.info("TaskManagerAgent initialized successfully")
 
         except Exception as e:
-            logger.error(f"Failed to initialize TaskManagerAgent: {str(e)}")
+            logger.error("Failed to initialize TaskManagerAgent: %s", e)
             raise
 
     def load_system_prompt(self):
         """Load the system prompt from file."""
         try:
-            prompt_path = Path(__file__).parent / "prompts" / "system_prompt.txt"
-            if not prompt_path.exists():
-                raise FileNotFoundError(
-                    f"System prompt file not found at {prompt_path}"
-                )
-
-            with open(prompt_path, "r", encoding="utf-8") as f:
-                self.system_prompt = f.read().strip()
-
-            if not self.system_prompt:
-                raise ValueError("System prompt is empty")
-
+            self.system_prompt = _load_system_prompt()
             self.messages = [{"role": "system", "content": self.system_prompt}]
             logger.debug("System prompt loaded successfully")
 
         except Exception as e:
-            logger.error(f"Failed to load system prompt: {str(e)}")
+            logger.error("Failed to load system prompt: %s", e)
 
             self.system_prompt = """You are an AI Task Manager assistant. Help users manage their tasks efficiently.
             Be concise, helpful, and action-oriented in your responses."""
             self.messages = [{"role": "system", "content": self.system_prompt}]
             logger.warning("Using fallback system prompt")
 
+    def _context_messages(self) -> list:
+        """
+        Build the messages sent to the model for the next completion.
+
+        Only the system prompt and the last MAX_HISTORY_TURNS turns are sent;
+        self.messages keeps the full conversation.
+
+        Returns:
+            List of messages for chat.completions.create
+        """
+        window = self.messages[1:][-2 * MAX_HISTORY_TURNS :]
+
+        # A tool result can't lead the window once its tool call is trimmed
+        start = 0
+        while start < len(window) and window[start]["role"] == "tool":
+            start += 1
+
+        return [self.messages[0]] + window[start:]
+
+    def _response_cache_key(self) -> str:
+        """
+        Hash the context that would be sent to the model for the next reply.
+
+        Everything else that shapes the completion request is hashed too, so
+        switching the model or changing a tool schema or sampling setting
+        doesn't return replies produced under the old configuration.
+
+        Returns:
+            Hex digest identifying the model, tool schemas, sampling settings,
+            system prompt, recent history and latest user message
+        """
+        request = {
+            "model": os.getenv("MODEL", FALLBACK_MODEL),
+            "tools": self.tools,
+            "temperature": TEMPERATURE,
+            "max_tokens": MAX_TOKENS,
+            "messages": self._context_messages(),
+        }
+        payload = orjson.dumps(request, option=orjson.OPT_SORT_KEYS, default=str)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _get_cached_response(self, cache_key: str) -> Optional[str]:
+        """
+        Look up a previously cached reply.
+
+        Args:
+            cache_key: Key from _response_cache_key
+
+        Returns:
+            The cached reply, or None if there is none or it is older than
+            RESPONSE_CACHE_TTL
+        """
+        try:
+            with shelve.open(str(RESPONSE_CACHE_PATH)) as cache:
+                entry = cache.get(cache_key)
+        except Exception as e:
+            logger.warning("Failed to read response cache: %s", e)
+            return None
+
+        # Entries are (stored_at, reply); anything else predates the TTL
+        if not isinstance(entry, tuple):
+            return None
+        stored_at, cached_response = entry
+        if time.time() - stored_at > RESPONSE_CACHE_TTL:
+            return None
+
+        logger.info("Returning cached response")
+        return cached_response
+
+    def _cache_response(self, cache_key: str, response: str):
+        """
+        Store a reply that was produced without any tool calls.
+
+        Replies that involved tool calls are not cached, since they depend
+        on (and may change) the stored tasks. Once the cache holds
+        RESPONSE_CACHE_MAX_ENTRIES replies, expired ones are dropped first,
+        then the oldest.
+
+        Args:
+            cache_key: Key from _response_cache_key
+            response: The assistant's reply
+        """
+        try:
+            with shelve.open(str(RESPONSE_CACHE_PATH)) as cache:
+                if cache_key not in cache and len(cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+                    _evict_responses(cache)
+                cache[cache_key] = (time.time(), response)
+        except Exception as e:
+            logger.warning("Failed to write response cache: %s", e)
+
     def handle_tool_call(self, tool_call):
         """
         Handle a single tool call with tracking for UI.
@@ -115,13 +369,13 @@ class TaskManagerAgent:
             return {"error": error_msg, "success": False}
 
         try:
-            function_args = json.loads(function_args_str)
-        except json.JSONDecodeError as e:
+            function_args = orjson.loads(function_args_str)
+        except orjson.JSONDecodeError as e:
             error_msg = f"Invalid JSON in function arguments: {str(e)}"
-            logger.error(f"{error_msg}. Raw arguments: {function_args_str}")
+            logger.error("%s. Raw arguments: %s", error_msg, function_args_str)
             return {"error": error_msg, "success": False}
 
-        tool_call_id = f"toolcall_{len(self.tool_calls) + 1}"
+        tool_call_id = f"toolcall_{next(self._tool_call_ids)}"
         tool_call_info = {
             "id": tool_call_id,
             "name": function_name,
@@ -133,31 +387,17 @@ class TaskManagerAgent:
             "error": None,
         }
         self.tool_calls.append(tool_call_info)
-        logger.info(f"Calling function: {function_name} with args: {function_args}")
+        logger.info("Calling function: %s with args: %s", function_name, function_args)
 
         try:
-            valid_functions = {
-                "add_task": add_task,
-                "update_task_status": update_task_status,
-                "get_tasks_by_status": get_tasks_by_status,
-                "get_all_tasks": get_all_tasks,
-                "generate_task_report": generate_task_report,
-            }
-
-            if function_name not in valid_functions:
+            function = self._tool_funcs.get(function_name)
+            if function is None:
                 error_msg = f"Unknown function: {function_name}"
                 logger.error(error_msg)
                 return {"error": error_msg, "success": False}
 
-            tool_call_info = next(
-                (t for t in self.tool_calls if t["id"] == tool_call_id), None
-            )
-
             try:
-                if function_name in ["get_all_tasks"]:
-                    result = valid_functions[function_name]()
-                else:
-                    result = valid_functions[function_name](**function_args)
+                result = function(**function_args)
 
                 if not isinstance(result, dict):
                     result = {"result": result, "success": True}
@@ -165,38 +405,39 @@ class TaskManagerAgent:
                 if "success" not in result:
                     result["success"] = True
 
-                if tool_call_info:
-                    tool_call_info.update(
-                        {
-                            "status": "completed",
-                            "end_time": datetime.now().isoformat(),
-                            "result": result,
-                            "success": True,
-                        }
-                    )
+                if function_name in TASK_MUTATING_TOOLS and result["success"]:
+                    TaskManagerAgent.tasks_version += 1
+
+                tool_call_info.update(
+                    {
+                        "status": "completed",
+                        "end_time": datetime.now().isoformat(),
+                        "result": result,
+                        "success": True,
+                    }
+                )
 
-                logger.info(f"Function {function_name} completed successfully")
-                logger.debug(f"Function {function_name} result: {result}")
+                logger.info("Function %s completed successfully", function_name)
+                logger.debug("Function %s result: %s", function_name, result)
 
                 return result
 
             except Exception as e:
                 error_msg = str(e)
-                if tool_call_info:
-                    tool_call_info.update(
-                        {
-                            "status": "error",
-                            "end_time": datetime.now().isoformat(),
-                            "error": error_msg,
-                            "success": False,
-                        }
-                    )
-                logger.error(f"Error in function {function_name}: {error_msg}")
+                tool_call_info.update(
+                    {
+                        "status": "error",
+                        "end_time": datetime.now().isoformat(),
+                        "error": error_msg,
+                        "success": False,
+                    }
+                )
+                logger.error("Error in function %s: %s", function_name, error_msg)
                 raise
 
         except TypeError as e:
             error_msg = f"Invalid arguments for {function_name}: {str(e)}"
-            logger.error(f"{error_msg}. Args: {function_args}")
+            logger.error("%s. Args: %s", error_msg, function_args)
             return {"error": error_msg, "success": False}
 
         except Exception as e:
@@ -207,6 +448,75 @@ class TaskManagerAgent:
                 "success": False,
             }
 
+    def get_summary(self) -> dict:
+        """
+        Generate the all-time task report without going through a tool call.
+
+        Returns:
+            Dict containing the task report
+        """
+        return self._tool_funcs["generate_task_report"](period="all")
+
+    def _run_tool_calls(self, tool_calls) -> list:
+        """
+        Execute the tool calls requested by the model.
+
+        Args:
+            tool_calls: Tool calls from an assistant message
+
+        Returns:
+            List of tool response messages to append to the conversation
+        """
+        valid_calls = []
+        for tool_call in tool_calls:
+            if not tool_call or not tool_call.function:
+                logger.warning("Skipping invalid tool call")
+                continue
+            valid_calls.append(tool_call)
+
+        # Read-only tools are independent, so a batch of them runs concurrently;
+        # anything that changes tasks runs in the order the model requested
+        if len(valid_calls) > 1 and not any(
+            tool_call.function.name in TASK_MUTATING_TOOLS for tool_call in valid_calls
+        ):
+            with ThreadPoolExecutor(max_workers=len(valid_calls)) as executor:
+                tool_results = list(executor.map(self.handle_tool_call, valid_calls))
+        else:
+            tool_results = [
+                self.handle_tool_call(tool_call) for tool_call in valid_calls
+            ]
+
+        tool_responses = []
+        for tool_call, tool_result in zip(valid_calls, tool_results):
+            try:
+                tool_result_str = orjson.dumps(tool_result, default=str).decode()
+                tool_responses.append(
+                    {
+                        "tool_call_id": tool_call.id,
+                        "role": "tool",
+                        "name": tool_call.function.name,
+                        "content": tool_result_str,
+                    }
+                )
+            except (TypeError, ValueError) as e:
+                error_msg = f"Failed to serialize tool result: {str(e)}"
+                logger.error("%s. Result: %s", error_msg, tool_result)
+                tool_responses.append(
+                    {
+                        "tool_call_id": tool_call.id,
+                        "role": "tool",
+                        "name": tool_call.function.name,
+                        "content": json.dumps(
+                            {
+                                "error": "Failed to process tool result",
+                                "success": False,
+                            }
+                        ),
+                    }
+                )
+
+        return tool_responses
+
     def process_message(self, user_message: str) -> str:
         """
         Process a user message and return the assistant's response.
@@ -221,16 +531,26 @@ class TaskManagerAgent:
             groq.GroqError: If there's an error communicating with the Groq API
             Exception: For any other unexpected errors
         """
+        from groq import GroqError
+
         if not user_message or not isinstance(user_message, str):
             error_msg = "Invalid message: message must be a non-empty string"
             logger.error(error_msg)
             return "I'm sorry, I didn't receive a valid message. Please try again."
 
         try:
+            self.tool_calls = []
             self.messages.append({"role": "user", "content": user_message.strip()})
-            logger.info(f"Processing user message: {user_message[:100]}...")
+            logger.info("Processing user message: %s...", user_message[:100])
+
+            cache_key = self._response_cache_key()
+            cached_response = self._get_cached_response(cache_key)
+            if cached_response is not None:
+                self.messages.append({"role": "assistant", "content": cached_response})
+                return cached_response
 
             current_iteration = 0
+            assistant_message = None
 
             while current_iteration < MAX_ITERATIONS:
                 current_iteration += 1
@@ -238,8 +558,8 @@ class TaskManagerAgent:
                 try:
                     response = self.client.chat.completions.create(
                         model=os.getenv("MODEL", FALLBACK_MODEL),
-                        messages=self.messages,
-                        tools=TOOLS,
+                        messages=self._context_messages(),
+                        tools=self.tools,
                         tool_choice="auto",
                         temperature=TEMPERATURE,
                         max_tokens=MAX_TOKENS,
@@ -251,51 +571,24 @@ class TaskManagerAgent:
                         return "I'm sorry, I encountered an issue processing your request. Please try again."
 
                     assistant_message = response.choices[0].message
-                    self.messages.append(assistant_message)
+                    self.messages.append(
+                        _assistant_message(
+                            assistant_message.content, assistant_message.tool_calls
+                        )
+                    )
 
                     if not assistant_message.tool_calls:
                         logger.info(
                             "No tool calls needed, returning assistant response"
                         )
+                        if current_iteration == 1 and assistant_message.content:
+                            self._cache_response(cache_key, assistant_message.content)
                         return (
                             assistant_message.content
                             or "I don't have a response for that."
                         )
 
-                    tool_responses = []
-                    for tool_call in assistant_message.tool_calls:
-                        if not tool_call or not tool_call.function:
-                            logger.warning("Skipping invalid tool call")
-                            continue
-
-                        tool_result = self.handle_tool_call(tool_call)
-
-                        try:
-                            tool_result_str = json.dumps(tool_result)
-                            tool_responses.append(
-                                {
-                                    "tool_call_id": tool_call.id,
-                                    "role": "tool",
-                                    "name": tool_call.function.name,
-                                    "content": tool_result_str,
-                                }
-                            )
-                        except (TypeError, ValueError) as e:
-                            error_msg = f"Failed to serialize tool result: {str(e)}"
-                            logger.error(f"{error_msg}. Result: {tool_result}")
-                            tool_responses.append(
-                                {
-                                    "tool_call_id": tool_call.id,
-                                    "role": "tool",
-                                    "name": tool_call.function.name,
-                                    "content": json.dumps(
-                                        {
-                                            "error": "Failed to process tool result",
-                                            "success": False,
-                                        }
-                                    ),
-                                }
-                            )
+                    tool_responses = self._run_tool_calls(assistant_message.tool_calls)
 
                     if tool_responses:
                         self.messages.extend(tool_responses)
@@ -321,7 +614,7 @@ class TaskManagerAgent:
                     return "I encountered an unexpected error. Please try again."
 
             return (
-                assistant_message.content
+                (assistant_message and assistant_message.content)
                 or "I'm having trouble processing your request. Please try again with more specific details."
             )
 
@@ -335,6 +628,130 @@ class TaskManagerAgent:
             logger.error(error_msg, exc_info=True)
             return "I encountered an unexpected error. Please try again."
 
+    def stream_message(self, user_message: str) -> Iterator[str]:
+        """
+        Process a user message and stream the assistant's response.
+
+        Tool calls requested by the model are executed between completions,
+        exactly as in process_message; only the final text is streamed.
+
+        Args:
+            user_message: The user's message
+
+        Yields:
+            Chunks of the assistant's response text as they arrive
+        """
+        from groq import GroqError
+
+        if not user_message or not isinstance(user_message, str):
+            error_msg = "Invalid message: message must be a non-empty string"
+            logger.error(error_msg)
+            yield "I'm sorry, I didn't receive a valid message. Please try again."
+            return
+
+        try:
+            self.tool_calls = []
+            self.messages.append({"role": "user", "content": user_message.strip()})
+            logger.info(
+                "Streaming response for user message: %s...", user_message[:100]
+            )
+
+            cache_key = self._response_cache_key()
+            cached_response = self._get_cached_response(cache_key)
+            if cached_response is not None:
+                self.messages.append({"role": "assistant", "content": cached_response})
+                yield cached_response
+                return
+
+            for iteration in range(MAX_ITERATIONS):
+                stream = self.client.chat.completions.create(
+                    model=os.getenv("MODEL", FALLBACK_MODEL),
+                    messages=self._context_messages(),
+                    tools=self.tools,
+                    tool_choice="auto",
+                    temperature=TEMPERATURE,
+                    max_tokens=MAX_TOKENS,
+                    stream=True,
+                )
+
+                content_parts = []
+                pending_calls = {}
+                finish_reason = None
+                for chunk in stream:
+                    if not chunk.choices:
+                        continue
+
+                    choice = chunk.choices[0]
+                    finish_reason = choice.finish_reason or finish_reason
+                    delta = choice.delta
+                    if delta.content:
+                        content_parts.append(delta.content)
+                        yield delta.content
+
+                    # Tool call arguments may arrive split across several chunks
+                    for tool_call_delta in delta.tool_calls or []:
+                        call = pending_calls.setdefault(
+                            tool_call_delta.index,
+                            {"id": None, "name": "", "arguments": ""},
+                        )
+                        if tool_call_delta.id:
+                            call["id"] = tool_call_delta.id
+                        if tool_call_delta.function:
+                            call["name"] += tool_call_delta.function.name or ""
+                            call["arguments"] += (
+                                tool_call_delta.function.arguments or ""
+                            )
+
+                content = "".join(content_parts)
+
+                if pending_calls and finish_reason != "tool_calls":
+                    # e.g. max_tokens cut the arguments off mid-stream
+                    logger.warning(
+                        "Discarding incomplete tool calls (finish_reason=%s)",
+                        finish_reason,
+                    )
+                    pending_calls = {}
+
+                if not pending_calls:
+                    logger.info("No tool calls needed, returning assistant response")
+                    self.messages.append({"role": "assistant", "content": content})
+                    if iteration == 0 and content:
+                        self._cache_response(cache_key, content)
+                    if not content:
+                        yield "I don't have a response for that."
+                    return
+
+                tool_calls = [
+                    SimpleNamespace(
+                        id=call["id"],
+                        function=SimpleNamespace(
+                            name=call["name"], arguments=call["arguments"] or "{}"
+                        ),
+                    )
+                    for _, call in sorted(pending_calls.items())
+                ]
+                self.messages.append(_assistant_message(content or None, tool_calls))
+
+                tool_responses = self._run_tool_calls(tool_calls)
+                if not tool_responses:
+                    logger.warning("No valid tool responses to add to conversation")
+                    yield "I encountered an issue processing your request. Please try again."
+                    return
+
+                self.messages.extend(tool_responses)
+
+            yield "I'm having trouble processing your request. Please try again with more specific details."
+
+        except GroqError as e:
+            error_msg = f"Groq API error: {str(e)}"
+            logger.error(error_msg)
+            yield "I'm having trouble connecting to the AI service. Please try again later."
+
+        except Exception as e:
+            error_msg = f"Unexpected error in stream_message: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            yield "I encountered an unexpected error. Please try again."
+
 
 def main():
     """Main entry point for the AI Task Manager."""
@@ -363,13 +780,13 @@ def main():
                 print(f"\nAssistant: {response}")
 
             except Exception as e:
-                logger.error(f"Error processing message: {e}", exc_info=True)
+                logger.error("Error processing message: %s", e, exc_info=True)
                 print("\nSorry, I encountered an error. Please try again.")
 
     except KeyboardInterrupt:
         print("\nGoodbye!")
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         print("\nAn unexpected error occurred. Please check the logs.")
 
 
@@ -5,14 +5,35 @@ This module provides functionality to add new tasks with various attributes
 like title, description, due date, priority, and status.
 """
 
-from datetime import datetime
-from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field, field_validator
+from datetime import date, datetime
+from typing import Dict, Any, Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from utils.db_utils import add_task as db_add_task
 
 
+def _check_due_date(due_date: Optional[str]) -> Optional[str]:
+    """Raise ValueError unless due_date is None or a real YYYY-MM-DD date."""
+    if due_date is None:
+        return due_date
+    try:
+        # fromisoformat also takes forms like 20231215 and 2023-W50-1 on
+        # 3.11+, so require the string to round-trip to keep YYYY-MM-DD
+        if date.fromisoformat(due_date).isoformat() != due_date:
+            raise ValueError(due_date)
+        return due_date
+    except ValueError as exc:
+        raise ValueError("due_date must be in YYYY-MM-DD format") from exc
+
+
 class AddTaskInput(BaseModel):
-    """Input model for the add_task tool."""
+    """
+    Input model for the add_task tool.
+
+    The tool function itself relies on the tool spec enums and the database
+    CHECK constraints; use this model when the input comes from elsewhere.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid", revalidate_instances="never")
 
     title: str = Field(..., description="The title of the task")
     description: Optional[str] = Field(
@@ -21,36 +42,25 @@ class AddTaskInput(BaseModel):
     due_date: Optional[str] = Field(
         None, description="Optional due date in YYYY-MM-DD format"
     )
-    priority: str = Field(
-        "medium",
-        description="Priority level of the task (low, medium, high)",
-        pattern=r"^(low|medium|high)$",
+    priority: Literal["low", "medium", "high"] = Field(
+        "medium", description="Priority level of the task (low, medium, high)"
     )
-    status: str = Field(
-        "todo",
-        description="Current status of the task (todo, in progress, done)",
-        pattern=r"^(todo|in progress|done)$",
+    status: Literal["todo", "in progress", "done"] = Field(
+        "todo", description="Current status of the task (todo, in progress, done)"
     )
 
     @field_validator("due_date")
     def validate_due_date(cls, v):
         """Validate the due_date format."""
-        if v is None:
-            return v
-        try:
-
-            datetime.strptime(v, "%Y-%m-%d")
-            return v
-        except ValueError as exc:
-            raise ValueError("due_date must be in YYYY-MM-DD format") from exc
+        return _check_due_date(v)
 
 
 def add_task(
     title: str,
     description: Optional[str] = None,
     due_date: Optional[str] = None,
-    priority: str = "medium",
-    status: str = "todo",
+    priority: Optional[str] = "medium",
+    status: Optional[str] = "todo",
 ) -> Dict[str, Any]:
     """
     Add a new task to the task manager with proper datetime handling.
@@ -59,8 +69,8 @@ def add_task(
         title: The title of the task
         description: Optional description of the task
         due_date: Optional due date in YYYY-MM-DD format
-        priority: Priority level (low, medium, high)
-        status: Current status (todo, in progress, done)
+        priority: Priority level (low, medium, high); None means medium
+        status: Current status (todo, in progress, done); None means todo
 
     Returns:
         Dict containing the result of the operation with task details
@@ -78,7 +88,17 @@ def add_task(
     try:
         created_at = datetime.now().isoformat(sep=" ", timespec="seconds")
 
-        task_input = AddTaskInput(
+        # priority and status are enforced by the tool spec enums and the
+        # tasks table CHECK constraints, so only the date needs a look here.
+        # A CHECK passes for NULL, though, so an explicit null from the model
+        # falls back to the default instead of being stored
+        _check_due_date(due_date)
+        if priority is None:
+            priority = "medium"
+        if status is None:
+            status = "todo"
+
+        task_id = db_add_task(
             title=title,
             description=description,
             due_date=due_date,
@@ -86,14 +106,6 @@ def add_task(
             status=status,
         )
 
-        task_id = db_add_task(
-            title=task_input.title,
-            description=task_input.description,
-            due_date=task_input.due_date,
-            priority=task_input.priority,
-            status=task_input.status,
-        )
-
         response = {
             "success": True,
             "task_id": task_id,
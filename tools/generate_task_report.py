@@ -5,19 +5,21 @@ This module provides functionality to generate reports about tasks,
 including statistics and summaries for different time periods.
 """
 
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
-from pydantic import BaseModel, Field
-from utils.db_utils import get_task_summary, get_tasks_by_status
+import functools
+from typing import Dict, Any, Literal, Optional
+from datetime import date, timedelta
+from pydantic import BaseModel, ConfigDict, Field
+from utils.db_utils import get_report_data
 
 
 class GenerateReportInput(BaseModel):
     """Input model for the generate_task_report tool."""
 
-    period: str = Field(
+    model_config = ConfigDict(frozen=True, extra="forbid", revalidate_instances="never")
+
+    period: Literal["daily", "weekly", "monthly", "all"] = Field(
         "daily",
         description="The time period for the report (daily, weekly, monthly, all)",
-        pattern=r"^(daily|weekly|monthly|all)$",
     )
 
 
@@ -31,14 +33,21 @@ def get_date_range(period: str) -> tuple[Optional[str], Optional[str]]:
     Returns:
         Tuple of (start_date, end_date) as strings in YYYY-MM-DD format
     """
-    today = datetime.now().date()
+    return _date_range_for(period, date.today().isoformat())
+
+
+@functools.lru_cache(maxsize=16)
+def _date_range_for(period: str, today_iso: str) -> tuple[Optional[str], Optional[str]]:
+    """Compute the range for ``period`` once per day; see get_date_range."""
+    today = date.fromisoformat(today_iso)
+    weekday = today.weekday()
 
     if period == "daily":
-        start_date = today.strftime("%Y-%m-%d")
-        end_date = (today + timedelta(days=1)).strftime("%Y-%m-%d")
+        start_date = today_iso
+        end_date = (today + timedelta(days=1)).isoformat()
     elif period == "weekly":
-        start_date = (today - timedelta(days=today.weekday())).strftime("%Y-%m-%d")
-        end_date = (today + timedelta(days=6 - today.weekday())).strftime("%Y-%m-%d")
+        start_date = (today - timedelta(days=weekday)).isoformat()
+        end_date = (today + timedelta(days=6 - weekday)).isoformat()
     elif period == "monthly":
         first_day = today.replace(day=1)
         if first_day.month == 12:
@@ -49,8 +58,8 @@ def get_date_range(period: str) -> tuple[Optional[str], Optional[str]]:
             last_day = first_day.replace(month=first_day.month + 1, day=1) - timedelta(
                 days=1
             )
-        start_date = first_day.strftime("%Y-%m-%d")
-        end_date = last_day.strftime("%Y-%m-%d")
+        start_date = first_day.isoformat()
+        end_date = last_day.isoformat()
     else:  # all
         start_date = None
         end_date = None
@@ -88,31 +97,8 @@ def generate_task_report(period: str = "daily") -> Dict[str, Any]:
     try:
         report_input = GenerateReportInput(period=period)
         start_date, end_date = get_date_range(report_input.period)
-        summary = get_task_summary()
-
-        completed_tasks = get_tasks_by_status("done")
-        recently_completed = sorted(
-            [dict(task) for task in completed_tasks],
-            key=lambda x: x.get("updated_at", ""),
-            reverse=True,
-        )[:5]
-
-        upcoming_deadlines = []
-        if period != "all":
-            all_tasks = []
-            for status in ["todo", "in progress"]:
-                all_tasks.extend(get_tasks_by_status(status))
-
-            upcoming_deadlines = sorted(
-                [
-                    dict(task)
-                    for task in all_tasks
-                    if task.get("due_date")
-                    and (start_date is None or task["due_date"] >= start_date)
-                    and (end_date is None or task["due_date"] <= end_date)
-                ],
-                key=lambda x: x.get("due_date", ""),
-            )[:5]
+        data = get_report_data(start_date, end_date, limit=5)
+        summary = data["summary"]
 
         return {
             "success": True,
@@ -125,8 +111,8 @@ def generate_task_report(period: str = "daily") -> Dict[str, Any]:
                 "in_progress": summary.get("in progress", 0),
                 "done": summary.get("done", 0),
             },
-            "recently_completed": recently_completed,
-            "upcoming_deadlines": upcoming_deadlines,
+            "recently_completed": data["recently_completed"],
+            "upcoming_deadlines": data["upcoming_deadlines"],
         }
 
     except Exception as e:
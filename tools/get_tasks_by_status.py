@@ -5,27 +5,38 @@ This module provides functionality to get a list of tasks
 filtered by their current status (todo, in progress, or done).
 """
 
-from typing import Dict, Any
-from pydantic import BaseModel, Field
+from typing import Dict, Any, Literal
+from pydantic import BaseModel, ConfigDict, Field
+from utils.db_utils import get_all_tasks_grouped as db_get_all_tasks_grouped
 from utils.db_utils import get_tasks_by_status as db_get_tasks_by_status
 
 
 class GetTasksByStatusInput(BaseModel):
     """Input model for the get_tasks_by_status tool."""
 
-    status: str = Field(
-        ...,
-        description="The status to filter tasks by (todo, in progress, done)",
-        pattern=r"^(todo|in progress|done)$",
+    model_config = ConfigDict(frozen=True, extra="forbid", revalidate_instances="never")
+
+    status: Literal["todo", "in progress", "done"] = Field(
+        ..., description="The status to filter tasks by (todo, in progress, done)"
     )
+    limit: int = Field(50, description="Maximum number of tasks to return", ge=1)
+    offset: int = Field(0, description="Number of tasks to skip", ge=0)
+
 
+# Validate straight through pydantic-core, skipping BaseModel.__init__
+_validator = GetTasksByStatusInput.__pydantic_validator__
 
-def get_tasks_by_status(status: str) -> Dict[str, Any]:
+
+def get_tasks_by_status(
+    status: str, limit: int = 50, offset: int = 0
+) -> Dict[str, Any]:
     """
-    Get all tasks with the specified status.
+    Get a page of tasks with the specified status, newest first.
 
     Args:
         status: The status to filter tasks by (todo, in progress, done)
+        limit: Maximum number of tasks to return (default 50)
+        offset: Number of tasks to skip, for fetching later pages
 
     Returns:
         Dict containing the list of tasks with the specified status
@@ -41,11 +52,16 @@ def get_tasks_by_status(status: str) -> Dict[str, Any]:
         }
     """
     try:
-        task_input = GetTasksByStatusInput(status=status)
-        tasks = db_get_tasks_by_status(task_input.status)
-        tasks_list = [dict(task) for task in tasks]
+        # limit and offset go straight into LIMIT/OFFSET, where a negative
+        # limit means no limit at all, so they must be checked here
+        task_input = _validator.validate_python(
+            {"status": status, "limit": limit, "offset": offset}
+        )
+        tasks = db_get_tasks_by_status(
+            task_input.status, limit=task_input.limit, offset=task_input.offset
+        )
 
-        return {"success": True, "tasks": tasks_list}
+        return {"success": True, "tasks": tasks}
 
     except Exception as e:
         return {
@@ -55,10 +71,13 @@ def get_tasks_by_status(status: str) -> Dict[str, Any]:
         }
 
 
-def get_all_tasks() -> Dict[str, Any]:
+def get_all_tasks(**_) -> Dict[str, Any]:
     """
     Get all tasks regardless of status.
 
+    Any keyword arguments are ignored, so the tool can be dispatched like
+    the others even if the model passes stray arguments.
+
     Returns:
         Dict containing all tasks in a flat list with a 'status' field
         Example:
@@ -72,13 +91,8 @@ def get_all_tasks() -> Dict[str, Any]:
         }
     """
     try:
-        all_tasks = []
-        for status in ["todo", "in progress", "done"]:
-            tasks = db_get_tasks_by_status(status)
-            for task in tasks:
-                task_dict = dict(task)
-                task_dict["status"] = status  # Ensure status is set
-                all_tasks.append(task_dict)
+        grouped = db_get_all_tasks_grouped()
+        all_tasks = [task for tasks in grouped.values() for task in tasks]
 
         return {"success": True, "tasks": all_tasks}
 
@@ -102,7 +116,17 @@ get_tasks_by_status_tool = {
                     "type": "string",
                     "enum": ["todo", "in progress", "done"],
                     "description": "The status to filter tasks by",
-                }
+                },
+                "limit": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Maximum number of tasks to return (default: 50)",
+                },
+                "offset": {
+                    "type": "integer",
+                    "minimum": 0,
+                    "description": "Number of tasks to skip, for paging (default: 0)",
+                },
             },
             "required": ["status"],
             "additionalProperties": False,
@@ -5,22 +5,26 @@ This module provides functionality to update the status of tasks
 in the task manager (e.g., from 'todo' to 'in progress' or 'done').
 """
 
-from typing import Dict, Any
-from pydantic import BaseModel, Field
+from typing import Dict, Any, Literal
+from pydantic import BaseModel, ConfigDict, Field
 from utils.db_utils import update_task_status as db_update_task_status
 
 
 class UpdateTaskStatusInput(BaseModel):
     """Input model for the update_task_status tool."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", revalidate_instances="never")
+
     task_id: int = Field(..., description="The ID of the task to update")
-    new_status: str = Field(
-        ...,
-        description="The new status for the task (todo, in progress, done)",
-        pattern=r"^(todo|in progress|done)$",
+    new_status: Literal["todo", "in progress", "done"] = Field(
+        ..., description="The new status for the task (todo, in progress, done)"
     )
 
 
+# Validate straight through pydantic-core, skipping BaseModel.__init__
+_validator = UpdateTaskStatusInput.__pydantic_validator__
+
+
 def update_task_status(task_id: int, new_status: str) -> Dict[str, Any]:
     """
     Update the status of an existing task and return the updated task details.
@@ -48,7 +52,9 @@ def update_task_status(task_id: int, new_status: str) -> Dict[str, Any]:
         }
     """
     try:
-        task_input = UpdateTaskStatusInput(task_id=task_id, new_status=new_status)
+        task_input = _validator.validate_python(
+            {"task_id": task_id, "new_status": new_status}
+        )
         result = db_update_task_status(
             task_id=task_input.task_id, new_status=task_input.new_status
         )
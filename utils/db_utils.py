@@ -5,24 +5,284 @@ This module provides functions to interact with the SQLite database,
 including creating tables and performing CRUD operations on tasks.
 """
 
+import atexit
+import itertools
+import json
 import sqlite3
-from typing import List, Dict, Any
+import threading
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Optional
 import os
+from datetime import datetime, timezone
 
 DB_PATH = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "db", "task_db.sqlite"
 )
 
 
-def get_db_connection():
-    """Create and return a database connection."""
-    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    return sqlite3.connect(DB_PATH)
+# Bump whenever init_db() changes so existing databases pick up the new DDL
+SCHEMA_VERSION = 4
+
+_conn: Optional[sqlite3.Connection] = None
+_schema_ready = False
+# Every thread shares _conn, and a SQLite transaction belongs to the whole
+# connection, so each statement (reads included) runs with this held. It is
+# re-entrant so the read helpers also work inside _transaction()
+_db_lock = threading.RLock()
+
+# Column order of every task row returned by the read helpers below
+_TASK_COLS = (
+    "id",
+    "title",
+    "description",
+    "due_date",
+    "priority",
+    "status",
+    "created_at",
+    "updated_at",
+)
+_TASK_COLS_SQL = ", ".join(_TASK_COLS)
+
+# Statements shared by the write paths. Keeping the text in one place means
+# every call passes the same SQL and reuses the connection's prepared statement.
+# _SQL_INSERT_TASK leaves created_at and updated_at to DEFAULT CURRENT_TIMESTAMP;
+# add_task and the status update bind _utc_now() instead.
+_SQL_INSERT_TASK = (
+    "INSERT INTO tasks (title, description, due_date, priority, status) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_SQL_INSERT_TASK_RETURNING_ID = (
+    "INSERT INTO tasks "
+    "(title, description, due_date, priority, status, created_at, updated_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?) RETURNING id"
+)
+# Rows fetched per query by iter_tasks_by_status
+_ITER_BATCH_ROWS = 500
+# add_tasks rows per INSERT: 100 rows x 5 columns stays within SQLite's
+# historical 999 bound-parameter limit
+_INSERT_CHUNK_ROWS = 100
+_SQL_UPDATE_STATUS = (
+    "UPDATE tasks SET status = ?, updated_at = ? "
+    f"WHERE id = ? RETURNING {_TASK_COLS_SQL}"
+)
+# Applies a JSON {"<id>": "<status>"} object in one statement; UPDATE ... FROM
+# needs SQLite 3.33+
+_SQL_UPDATE_STATUSES = (
+    "UPDATE tasks SET status = j.value, updated_at = ? "
+    "FROM json_each(?) AS j WHERE tasks.id = CAST(j.key AS INTEGER) "
+    "RETURNING tasks.id, tasks.status"
+)
+
+# Read statements, built once so each call hands sqlite3 the same SQL text
+_SQL_SELECT_BY_STATUS = f"""
+    SELECT {_TASK_COLS_SQL}
+    FROM tasks
+    WHERE status = ?
+    ORDER BY created_at DESC, id DESC
+    LIMIT ? OFFSET ?
+    """
+# The next page after (created_at, id), for iter_tasks_by_status
+_SQL_SELECT_BY_STATUS_AFTER = f"""
+    SELECT {_TASK_COLS_SQL}
+    FROM tasks
+    WHERE status = ? AND (created_at, id) < (?, ?)
+    ORDER BY created_at DESC, id DESC
+    LIMIT ?
+    """
+_SQL_SELECT_ALL = f"""
+    SELECT {_TASK_COLS_SQL}
+    FROM tasks
+    ORDER BY created_at DESC, id DESC
+    """
+_SQL_SELECT_RECENT_DONE = f"""
+    SELECT {_TASK_COLS_SQL}
+    FROM tasks
+    WHERE status = 'done'
+    ORDER BY updated_at DESC
+    LIMIT ?
+    """
+_SQL_SELECT_UPCOMING = f"""
+    SELECT {_TASK_COLS_SQL}
+    FROM tasks
+    WHERE status IN ('todo', 'in progress')
+      AND due_date BETWEEN ? AND ?
+    ORDER BY due_date
+    LIMIT ?
+    """
+_SQL_SUMMARY = """
+    SELECT SUM(status = 'todo'), SUM(status = 'in progress'), SUM(status = 'done')
+    FROM tasks
+    """
+
+# (title, description, due_date, priority, status) rows for populate_sample_tasks
+_SAMPLE_ROWS = [
+    (
+        "Complete AI assignment",
+        "Finish the machine learning project for CS101",
+        "2023-12-15",
+        "high",
+        "todo",
+    ),
+    ("Grocery shopping", "Buy milk, eggs, and bread", "2023-12-10", "medium", "todo"),
+    ("Call mom", "Wish her happy birthday", "2023-12-12", "high", "in progress"),
+    (
+        "Read research paper",
+        "Read the latest paper on transformers",
+        "2023-12-20",
+        "low",
+        "todo",
+    ),
+    (
+        "Submit expense report",
+        "Submit monthly expenses to accounting",
+        "2023-12-05",
+        "medium",
+        "done",
+    ),
+]
+
+
+def _utc_now() -> str:
+    """Return the current UTC time in CURRENT_TIMESTAMP's YYYY-MM-DD HH:MM:SS form."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def get_db_connection() -> sqlite3.Connection:
+    """
+    Return the process-wide database connection, opening it on first use.
+
+    One connection serves every thread, including Streamlit's per-rerun
+    script threads and the tool thread pool, so the connect, pragma setup
+    and schema check happen once per process. It runs in autocommit mode;
+    hold ``_db_lock`` around statements on it, or use ``_transaction()``.
+
+    Returns:
+        sqlite3.Connection: The shared connection
+    """
+    if _conn is None:
+        _open_connection()
+    return _conn
+
+
+def _open_connection() -> None:
+    """Open the shared connection and bring its schema up to date."""
+    global _conn
+    with _db_lock:
+        # Another thread may have opened it while we waited
+        if _conn is not None:
+            return
+        on_disk = DB_PATH != ":memory:"
+        if on_disk and not _schema_ready:
+            # Only needed before the first connection builds the schema
+            os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+        conn = sqlite3.connect(
+            DB_PATH,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=512,
+        )
+        if on_disk:
+            # WAL and memory-mapped reads only make sense for a file database
+            conn.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                PRAGMA mmap_size=268435456;
+                """
+            )
+        conn.executescript(
+            """
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA foreign_keys=ON;
+            PRAGMA busy_timeout=5000;
+            """
+        )
+        # Other threads see the connection now but wait on _db_lock until
+        # the schema is ready
+        _conn = conn
+        try:
+            ensure_schema()
+        except BaseException:
+            # Drop the connection so the next call retries the schema setup,
+            # e.g. after another process held the write lock too long
+            _conn = None
+            conn.close()
+            raise
+
+
+@atexit.register
+def _close_connection() -> None:
+    """Close the shared connection, if it was opened."""
+    global _conn
+    with _db_lock:
+        if _conn is not None:
+            # Let SQLite refresh planner statistics before the connection goes
+            _conn.execute("PRAGMA optimize")
+            _conn.close()
+            _conn = None
+
+
+@contextmanager
+def _transaction(write: bool = True) -> Iterator[sqlite3.Connection]:
+    """
+    Run the enclosed statements in one transaction on the shared connection.
+
+    Write transactions start with BEGIN IMMEDIATE, taking SQLite's write lock
+    up front instead of upgrading from a read lock mid-transaction, which is
+    where concurrent WAL writers hit SQLITE_BUSY.
+
+    Args:
+        write: Take SQLite's write lock for the transaction; pass False for
+            read-only snapshots so they don't block writers in other
+            processes
+    """
+    conn = get_db_connection()
+    with _db_lock:
+        conn.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            # A failed COMMIT can leave the transaction open, while some
+            # errors make SQLite roll back on its own first
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+
+def ensure_schema() -> None:
+    """
+    Create or upgrade the schema once per process.
+
+    The database's ``PRAGMA user_version`` records the schema it was built
+    with, so an up-to-date file skips the DDL entirely.
+    """
+    global _schema_ready
+    if _schema_ready:
+        return
+    with _db_lock:
+        # Another thread may have finished the migration while we waited
+        if _schema_ready:
+            return
+        conn = get_db_connection()
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            init_db()
+            # Existing rows need statistics for the new indexes; on an empty
+            # table ANALYZE records nothing, so populate_sample_tasks redoes it
+            if conn.execute("SELECT EXISTS (SELECT 1 FROM tasks)").fetchone()[0]:
+                conn.execute("ANALYZE tasks")
+        # Without sqlite_stat1 rows the planner prefers the (status, ...)
+        # indexes plus a sort over the partial indexes. 0x10002 is the flag
+        # set SQLite recommends at open: on 3.46+ it checks every table, not
+        # only those this connection has queried
+        conn.execute("PRAGMA optimize=0x10002")
+        _schema_ready = True
 
 
 def init_db():
     """Initialize the database with the required tables."""
-    with get_db_connection() as conn:
+    with _transaction() as conn:
         cursor = conn.cursor()
 
         cursor.execute(
@@ -40,17 +300,38 @@ def init_db():
         """
         )
 
+        # get_tasks_by_status filters on status and orders by created_at, so
+        # (status, created_at) serves it straight from the index with no sort
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_status_created "
+            "ON tasks(status, created_at)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_status_due ON tasks(status, due_date)"
+        )
+        # No query filters on due_date alone; the open-task index covers the
+        # report's date range, so this one only added write cost
+        cursor.execute("DROP INDEX IF EXISTS idx_tasks_due_date")
+        # Partial indexes for the report queries: they only cover the rows
+        # those queries can match, so they stay small as history grows
+        cursor.execute(
+            """
+        CREATE INDEX IF NOT EXISTS idx_tasks_open_due ON tasks(due_date)
+        WHERE status IN ('todo', 'in progress')
+        """
+        )
         cursor.execute(
             """
-        CREATE TRIGGER IF NOT EXISTS update_task_timestamp
-        AFTER UPDATE ON tasks
-        BEGIN
-            UPDATE tasks SET updated_at = datetime('now') WHERE id = NEW.id;
-        END;
+        CREATE INDEX IF NOT EXISTS idx_tasks_done_updated ON tasks(updated_at DESC)
+        WHERE status = 'done'
         """
         )
 
-        conn.commit()
+        # updated_at is set inline by the writes; the old trigger only
+        # repeated that with a second UPDATE per row
+        cursor.execute("DROP TRIGGER IF EXISTS update_task_timestamp")
+
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
 
 def add_task(
@@ -63,8 +344,8 @@ def add_task(
     """
     Add a new task to the database.
 
-    Note: The database automatically sets created_at and updated_at timestamps
-    using SQLite's CURRENT_TIMESTAMP.
+    Note: created_at and updated_at are both set to the current UTC time, in
+    the same format as SQLite's CURRENT_TIMESTAMP.
 
     Args:
         title: The title of the task
@@ -76,28 +357,63 @@ def add_task(
     Returns:
         int: The ID of the newly created task
     """
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            -- created_at and updated_at are automatically set by the database
-            -- using DEFAULT CURRENT_TIMESTAMP in the schema
-            INSERT INTO tasks (title, description, due_date, priority, status)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (title, description, due_date, priority, status),
+    now = _utc_now()
+    with _transaction() as conn:
+        cursor = conn.execute(
+            _SQL_INSERT_TASK_RETURNING_ID,
+            (title, description, due_date, priority, status, now, now),
         )
-        conn.commit()
-        return cursor.lastrowid
+        return cursor.fetchone()[0]
+
+
+def add_tasks(tasks: List[Dict[str, Any]]) -> List[int]:
+    """
+    Add many tasks at once using multi-row INSERT statements.
+
+    Each task dict takes the same keys as ``add_task``'s arguments; only
+    'title' is required. Rows are inserted in chunks of ``_INSERT_CHUNK_ROWS``
+    inside one transaction.
+
+    Args:
+        tasks: The tasks to insert, in order
+
+    Returns:
+        List[int]: The IDs of the new tasks, in the same order as ``tasks``
+    """
+    rows = [
+        (
+            task["title"],
+            task.get("description"),
+            task.get("due_date"),
+            task.get("priority", "medium"),
+            task.get("status", "todo"),
+        )
+        for task in tasks
+    ]
+
+    task_ids = []
+    with _transaction() as conn:
+        for start in range(0, len(rows), _INSERT_CHUNK_ROWS):
+            chunk = rows[start : start + _INSERT_CHUNK_ROWS]
+            placeholders = ", ".join(["(?, ?, ?, ?, ?)"] * len(chunk))
+            cursor = conn.execute(
+                "INSERT INTO tasks (title, description, due_date, priority, status) "
+                f"VALUES {placeholders}",
+                list(itertools.chain.from_iterable(chunk)),
+            )
+            # AUTOINCREMENT ids from one statement under the write lock are
+            # consecutive, ending at lastrowid
+            last_id = cursor.lastrowid
+            task_ids.extend(range(last_id - len(chunk) + 1, last_id + 1))
+    return task_ids
 
 
 def update_task_status(task_id: int, new_status: str) -> Dict[str, Any]:
     """
     Update the status of a task and return the updated task details.
 
-    This function updates the task status and automatically sets the updated_at
-    timestamp to the current time. The database trigger 'update_task_timestamp'
-    ensures updated_at is always current on any update.
+    This function updates the task status and sets the updated_at timestamp
+    to the current time in the same statement.
 
     Args:
         task_id: The ID of the task to update
@@ -124,49 +440,58 @@ def update_task_status(task_id: int, new_status: str) -> Dict[str, Any]:
             }
         }
     """
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
+    # Update task status and set updated_at to current time; the RETURNING
+    # clause hands back the updated row from the same statement
+    with _transaction() as conn:
+        cursor = conn.execute(_SQL_UPDATE_STATUS, (new_status, _utc_now(), task_id))
+        updated_task = cursor.fetchone()
 
-        # Update task status and set updated_at to current time
-        # The RETURNING clause returns the updated row
-        cursor.execute(
-            """
-            UPDATE tasks 
-            SET status = ?,
-                updated_at = datetime('now')
-            WHERE id = ?
-            RETURNING *  -- Returns all columns of the updated row
-            """,
-            (new_status, task_id),
-        )
+    if not updated_task:
+        return {"success": False, "message": f"Task with ID {task_id} not found"}
 
-        # Fetch the updated task data
-        updated_task = cursor.fetchone()
-        conn.commit()
+    # SQLite returns datetime as string in ISO 8601 format
+    # No conversion needed as we want to keep it consistent
+    task_dict = dict(zip(_TASK_COLS, updated_task))
 
-        if not updated_task:
-            return {"success": False, "message": f"Task with ID {task_id} not found"}
+    return {
+        "success": True,
+        "message": "Task status updated successfully",
+        "task": task_dict,  # Includes all task fields including timestamps
+    }
 
-        # Convert SQLite Row to dict for easier handling
-        columns = [column[0] for column in cursor.description]
-        task_dict = dict(zip(columns, updated_task))
 
-        # SQLite returns datetime as string in ISO 8601 format
-        # No conversion needed as we want to keep it consistent
+def update_task_statuses(updates: Dict[int, str]) -> List[Dict[str, Any]]:
+    """
+    Update the status of several tasks in a single statement.
 
-        return {
-            "success": True,
-            "message": "Task status updated successfully",
-            "task": task_dict,  # Includes all task fields including timestamps
-        }
+    The whole batch is applied in one transaction; if any new status fails
+    the CHECK constraint, nothing is changed and the IntegrityError propagates.
+
+    Args:
+        updates: Mapping of task ID to its new status ('todo', 'in progress',
+            'done')
+
+    Returns:
+        List[Dict[str, Any]]: The applied updates as {'id', 'status'} dicts,
+        ordered by ID; IDs that matched no task are left out
+    """
+    payload = json.dumps({str(task_id): new for task_id, new in updates.items()})
+    with _transaction() as conn:
+        rows = conn.execute(_SQL_UPDATE_STATUSES, (_utc_now(), payload)).fetchall()
+    return [{"id": task_id, "status": status} for task_id, status in sorted(rows)]
 
 
-def get_tasks_by_status(status: str) -> List[Dict[str, Any]]:
+def get_tasks_by_status(
+    status: str, limit: Optional[int] = None, offset: int = 0
+) -> List[Dict[str, Any]]:
     """
-    Get all tasks with the given status, including all timestamps.
+    Get tasks with the given status, including all timestamps.
 
     Args:
         status: The status to filter by ('todo', 'in progress', 'done')
+        limit: Maximum number of tasks to return; None (the default) returns
+            all of them
+        offset: Number of tasks to skip, for fetching later pages
 
     Returns:
         List[Dict[str, Any]]: A list of task dictionaries with all fields including timestamps
@@ -187,27 +512,102 @@ def get_tasks_by_status(status: str) -> List[Dict[str, Any]]:
             ...
         ]
     """
-    with get_db_connection() as conn:
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT 
-                id, 
-                title, 
-                description, 
-                due_date, 
-                priority, 
-                status,
-                created_at,
-                updated_at
-            FROM tasks 
-            WHERE status = ?
-            ORDER BY created_at DESC
-            """,
-            (status,),
-        )
-        return [dict(row) for row in cursor.fetchall()]
+    conn = get_db_connection()
+    with _db_lock:
+        rows = conn.execute(
+            _SQL_SELECT_BY_STATUS, (status, -1 if limit is None else limit, offset)
+        ).fetchall()
+    return [dict(zip(_TASK_COLS, row)) for row in rows]
+
+
+def iter_tasks_by_status(status: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every task with the given status, newest first, one row at a time.
+
+    Unlike ``get_tasks_by_status`` this never builds the full list, so large
+    result sets can be streamed straight into a serializer. Rows are read
+    ``_ITER_BATCH_ROWS`` at a time, each batch its own query continuing from
+    the last row seen, so the shared connection is free between batches. A
+    task whose status changes mid-iteration may be missed.
+
+    Args:
+        status: The status to filter by ('todo', 'in progress', 'done')
+
+    Yields:
+        Dict[str, Any]: One task dictionary per matching row
+    """
+    conn = get_db_connection()
+    with _db_lock:
+        rows = conn.execute(
+            _SQL_SELECT_BY_STATUS, (status, _ITER_BATCH_ROWS, 0)
+        ).fetchall()
+    while rows:
+        for row in rows:
+            yield dict(zip(_TASK_COLS, row))
+        if len(rows) < _ITER_BATCH_ROWS:
+            return
+        last = dict(zip(_TASK_COLS, rows[-1]))
+        with _db_lock:
+            rows = conn.execute(
+                _SQL_SELECT_BY_STATUS_AFTER,
+                (status, last["created_at"], last["id"], _ITER_BATCH_ROWS),
+            ).fetchall()
+
+
+def get_all_tasks_grouped() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Get every task in one query, partitioned by status.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Tasks keyed by 'todo', 'in progress'
+        and 'done' (in that order, each possibly empty), newest first
+    """
+    conn = get_db_connection()
+    with _db_lock:
+        rows = conn.execute(_SQL_SELECT_ALL).fetchall()
+    grouped = {status: [] for status in ("todo", "in progress", "done")}
+    for row in rows:
+        task = dict(zip(_TASK_COLS, row))
+        grouped[task["status"]].append(task)
+    return grouped
+
+
+def get_recently_completed_tasks(limit: int = 5) -> List[Dict[str, Any]]:
+    """
+    Get the most recently completed tasks.
+
+    Args:
+        limit: Maximum number of tasks to return
+
+    Returns:
+        List[Dict[str, Any]]: Done tasks, most recently updated first
+    """
+    conn = get_db_connection()
+    with _db_lock:
+        rows = conn.execute(_SQL_SELECT_RECENT_DONE, (limit,)).fetchall()
+    return [dict(zip(_TASK_COLS, row)) for row in rows]
+
+
+def get_upcoming_tasks(
+    start_date: str, end_date: str, limit: int = 5
+) -> List[Dict[str, Any]]:
+    """
+    Get open tasks due within a date range, soonest first.
+
+    Args:
+        start_date: First due date to include, in YYYY-MM-DD format
+        end_date: Last due date to include, in YYYY-MM-DD format
+        limit: Maximum number of tasks to return
+
+    Returns:
+        List[Dict[str, Any]]: 'todo' and 'in progress' tasks ordered by due date
+    """
+    conn = get_db_connection()
+    with _db_lock:
+        rows = conn.execute(
+            _SQL_SELECT_UPCOMING, (start_date, end_date, limit)
+        ).fetchall()
+    return [dict(zip(_TASK_COLS, row)) for row in rows]
 
 
 def get_task_summary() -> Dict[str, int]:
@@ -217,23 +617,43 @@ def get_task_summary() -> Dict[str, int]:
     Returns:
         Dict[str, int]: A dictionary with task counts by status
     """
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-        SELECT status, COUNT(*) as count 
-        FROM tasks 
-        GROUP BY status
-        """
-        )
-        result = {row[0]: row[1] for row in cursor.fetchall()}
+    # One pass producing a fixed-shape row; SUM over no rows is NULL, hence "or 0"
+    conn = get_db_connection()
+    with _db_lock:
+        row = conn.execute(_SQL_SUMMARY).fetchone()
+    return {"todo": row[0] or 0, "in progress": row[1] or 0, "done": row[2] or 0}
 
-        # Ensure all statuses are present in the result
-        for status in ["todo", "in progress", "done"]:
-            if status not in result:
-                result[status] = 0
 
-        return result
+def get_report_data(
+    start_date: Optional[str], end_date: Optional[str], limit: int = 5
+) -> Dict[str, Any]:
+    """
+    Fetch everything a task report needs in one read transaction.
+
+    The summary, recently completed and upcoming queries run back to back on
+    the shared connection inside a single BEGIN/COMMIT, so they see one
+    consistent snapshot of the table.
+
+    Args:
+        start_date: First due date for upcoming deadlines, or None to skip them
+        end_date: Last due date for upcoming deadlines, or None to skip them
+        limit: Maximum number of tasks in each list
+
+    Returns:
+        Dict with 'summary', 'recently_completed' and 'upcoming_deadlines'
+    """
+    with _transaction(write=False):
+        summary = get_task_summary()
+        recently_completed = get_recently_completed_tasks(limit)
+        upcoming_deadlines = []
+        if start_date is not None and end_date is not None:
+            upcoming_deadlines = get_upcoming_tasks(start_date, end_date, limit)
+
+    return {
+        "summary": summary,
+        "recently_completed": recently_completed,
+        "upcoming_deadlines": upcoming_deadlines,
+    }
 
 
 def populate_sample_tasks() -> Dict[str, int]:
@@ -243,87 +663,48 @@ def populate_sample_tasks() -> Dict[str, int]:
     Returns:
         Dict[str, int]: A dictionary with the count of tasks added
     """
-    sample_tasks = [
-        {
-            "title": "Complete AI assignment",
-            "description": "Finish the machine learning project for CS101",
-            "due_date": "2023-12-15",
-            "priority": "high",
-            "status": "todo",
-        },
-        {
-            "title": "Grocery shopping",
-            "description": "Buy milk, eggs, and bread",
-            "due_date": "2023-12-10",
-            "priority": "medium",
-            "status": "todo",
-        },
-        {
-            "title": "Call mom",
-            "description": "Wish her happy birthday",
-            "due_date": "2023-12-12",
-            "priority": "high",
-            "status": "in progress",
-        },
-        {
-            "title": "Read research paper",
-            "description": "Read the latest paper on transformers",
-            "due_date": "2023-12-20",
-            "priority": "low",
-            "status": "todo",
-        },
-        {
-            "title": "Submit expense report",
-            "description": "Submit monthly expenses to accounting",
-            "due_date": "2023-12-05",
-            "priority": "medium",
-            "status": "done",
-        },
-    ]
-
     added_count = 0
-    with get_db_connection() as conn:
+    # The write transaction is IMMEDIATE, so no other process can insert
+    # between the count and ours
+    with _transaction() as conn:
         cursor = conn.cursor()
         # First, check if we already have any tasks to avoid duplicates
         cursor.execute("SELECT COUNT(*) FROM tasks")
         if cursor.fetchone()[0] == 0:
-            for task in sample_tasks:
-                cursor.execute(
-                    """
-                INSERT INTO tasks (title, description, due_date, priority, status)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                    (
-                        task["title"],
-                        task["description"],
-                        task["due_date"],
-                        task["priority"],
-                        task["status"],
-                    ),
-                )
-                added_count += 1
-            conn.commit()
+            cursor.executemany(_SQL_INSERT_TASK, _SAMPLE_ROWS)
+            added_count = cursor.rowcount
+            # An empty table had no statistics to give the planner
+            cursor.execute("ANALYZE tasks")
 
     return {"tasks_added": added_count}
 
 
-def clear_all_tasks() -> Dict[str, int]:
+def clear_all_tasks(vacuum: bool = False) -> Dict[str, int]:
     """
-    Remove all tasks from the database.
+    Remove all tasks from the database and restart task IDs at 1.
+
+    Args:
+        vacuum: Also run VACUUM afterwards to give the freed pages back to
+            the filesystem
 
     Returns:
         Dict[str, int]: A dictionary with the count of tasks removed
     """
-    with get_db_connection() as conn:
+    with _transaction() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM tasks")
-        count = cursor.fetchone()[0]
+        # An unfiltered DELETE on a trigger-free table takes SQLite's truncate
+        # path, and rowcount still reports how many rows went
         cursor.execute("DELETE FROM tasks")
-        conn.commit()
+        count = cursor.rowcount
+        cursor.execute("DELETE FROM sqlite_sequence WHERE name = 'tasks'")
+
+    if vacuum:
+        # VACUUM cannot run inside a transaction
+        conn = get_db_connection()
+        with _db_lock:
+            conn.execute("VACUUM")
     return {"tasks_removed": count}
 
 
-init_db()
-
 # Uncomment the following line to populate with sample data when the module is imported
 # populate_sample_tasks()